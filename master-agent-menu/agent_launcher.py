@@ -6,8 +6,10 @@ import os
 import sys
 import asyncio
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Iterator, Tuple
 import logging
 from datetime import datetime
 import json
@@ -83,6 +85,7 @@ class AgentLauncher:
         
         # Track running agents
         self.running_agents: Dict[str, AgentProcess] = {}
+        self._lock = threading.Lock()
         
         # Initialize registry
         self.registry.discover_agents()
@@ -91,16 +94,19 @@ class AgentLauncher:
     
     def list_agents(self, category: str = None, status: str = None) -> List[AgentInfo]:
         """List available agents, optionally filtered by category or status"""
-        agents = list(self.registry.agents.values())
-        
         if category:
-            agents = [agent for agent in agents if agent.category == category]
+            agents = self.registry.get_agents_by_category(category)
+        else:
+            agents = list(self.registry.agents.values())
         
         if status:
+            # Snapshot once so launches and stops on other threads cannot change it mid-filter
+            with self._lock:
+                running = frozenset(self.running_agents)
             if status == "running":
-                agents = [agent for agent in agents if agent.name in self.running_agents]
+                agents = [agent for agent in agents if agent.name in running]
             elif status == "stopped":
-                agents = [agent for agent in agents if agent.name not in self.running_agents]
+                agents = [agent for agent in agents if agent.name not in running]
         
         return agents
     
@@ -262,7 +268,8 @@ class AgentLauncher:
             
             # Create agent process object
             agent_process = AgentProcess(agent_name, process, config)
-            self.running_agents[agent_name] = agent_process
+            with self._lock:
+                self.running_agents[agent_name] = agent_process
             
             # Start monitoring
             self.status_monitor.start_monitoring(agent_name, process)
@@ -276,16 +283,19 @@ class AgentLauncher:
     
     def stop_agent(self, agent_name: str) -> bool:
         """Stop a running agent"""
-        if agent_name not in self.running_agents:
+        with self._lock:
+            agent_process = self.running_agents.get(agent_name)
+        
+        if agent_process is None:
             logger.warning(f"Agent {agent_name} is not running")
             return False
         
-        agent_process = self.running_agents[agent_name]
         success = agent_process.stop()
         
         if success:
             self.status_monitor.stop_monitoring(agent_name)
-            del self.running_agents[agent_name]
+            with self._lock:
+                self.running_agents.pop(agent_name, None)
             logger.info(f"Agent {agent_name} stopped successfully")
         
         return success
@@ -299,8 +309,8 @@ class AgentLauncher:
     
     def get_agent_status(self, agent_name: str) -> Dict[str, Any]:
         """Get status of an agent"""
-        if agent_name in self.running_agents:
-            agent_process = self.running_agents[agent_name]
+        agent_process = self.running_agents.get(agent_name)
+        if agent_process is not None:
             status = agent_process.get_info()
             status.update(self.status_monitor.get_agent_metrics(agent_name))
             return status
@@ -320,14 +330,26 @@ class AgentLauncher:
         
         return statuses
     
+    def iter_statuses(self, max_workers: int = 16) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (agent_name, status) pairs as each status lookup completes"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.get_agent_status, agent_name): agent_name
+                for agent_name in list(self.registry.agents.keys())
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
     def stop_all_agents(self) -> Dict[str, bool]:
-        """Stop all running agents"""
-        results = {}
+        """Stop all running agents, waiting on their shutdowns in parallel"""
+        with self._lock:
+            agent_names = list(self.running_agents.keys())
         
-        for agent_name in list(self.running_agents.keys()):
-            results[agent_name] = self.stop_agent(agent_name)
+        if not agent_names:
+            return {}
         
-        return results
+        with ThreadPoolExecutor(max_workers=min(32, len(agent_names))) as executor:
+            return dict(zip(agent_names, executor.map(self.stop_agent, agent_names)))
     
     def create_combination(self, combination_name: str, agent_names: List[str], **kwargs) -> bool:
         """Create and launch an agent combination"""
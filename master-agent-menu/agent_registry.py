@@ -6,9 +6,11 @@ import os
 import json
 import yaml
 import glob
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from datetime import datetime
 import logging
 
@@ -31,6 +33,11 @@ class AgentInfo:
     supported_models: List[str]
     last_modified: datetime
     status: str = "discovered"  # discovered, configured, active, inactive, error
+    
+    @cached_property
+    def short_description(self) -> str:
+        """Description truncated to 60 characters for list views, computed once"""
+        return self.description[:60] + "..." if self.description[60:61] else self.description
 
 @dataclass
 class AgentCombination:
@@ -54,6 +61,10 @@ class AgentRegistry:
         
         self.agents: Dict[str, AgentInfo] = {}
         self.combinations: Dict[str, AgentCombination] = {}
+        self.agents_by_category: Dict[str, List[AgentInfo]] = {}
+        self.version = 0  # Bumped whenever the set of agents is reloaded
+        # Statistics keyed by (version, number of combinations) they were computed for
+        self._statistics_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
         self.agent_categories = {
             "mcp": ["mcp-agent-army", "pydantic-ai-mcp-agent", "simple-mcp-agent", "n8n-mcp-agent", "thirdbrain-mcp-openai-agent"],
             "research": ["advanced-web-researcher", "general-researcher-agent", "small-business-researcher"],
@@ -75,10 +86,11 @@ class AgentRegistry:
         """Discover all agents in the repository"""
         logger.info(f"Discovering agents in {self.repo_root}")
         
-        # Get all directories that might contain agents
-        potential_agent_dirs = [d for d in self.repo_root.iterdir() 
-                              if d.is_dir() and not d.name.startswith('.') 
-                              and d.name != 'master-agent-menu']
+        # Get all directories that might contain agents (scandir caches the entry type)
+        with os.scandir(self.repo_root) as entries:
+            potential_agent_dirs = [Path(entry.path) for entry in entries
+                                    if entry.is_dir() and not entry.name.startswith('.')
+                                    and entry.name != 'master-agent-menu']
         
         for agent_dir in potential_agent_dirs:
             try:
@@ -90,7 +102,19 @@ class AgentRegistry:
                 logger.warning(f"Error analyzing {agent_dir.name}: {e}")
         
         logger.info(f"Discovered {len(self.agents)} agents")
+        self._rebuild_category_index()
         self._setup_default_combinations()
+        self.version += 1
+    
+    def _list_files(self, agent_dir: Path) -> List[Path]:
+        """List the regular files in a directory with a single scandir pass"""
+        with os.scandir(agent_dir) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_file()]
+    
+    @staticmethod
+    def _match_files(files: List[Path], pattern: str) -> List[Path]:
+        """Filter a directory listing by a glob pattern"""
+        return [f for f in files if fnmatchcase(f.name, pattern)]
     
     def _analyze_agent_directory(self, agent_dir: Path) -> Optional[AgentInfo]:
         """Analyze a directory to determine if it contains an agent"""
@@ -100,8 +124,11 @@ class AgentRegistry:
         if agent_dir.name in skip_dirs or agent_dir.name.startswith('~'):
             return None
         
+        # List the directory once and match every pattern against that listing
+        files = self._list_files(agent_dir)
+        
         # Look for Python files that might be main entry points
-        python_files = list(agent_dir.glob("*.py"))
+        python_files = self._match_files(files, "*.py")
         main_candidates = []
         
         for py_file in python_files:
@@ -115,8 +142,8 @@ class AgentRegistry:
         
         if not main_candidates:
             # Check for other indicators of an agent (README, requirements, etc.)
-            has_readme = any(agent_dir.glob("README*"))
-            has_requirements = any(agent_dir.glob("requirements.txt"))
+            has_readme = bool(self._match_files(files, "README*"))
+            has_requirements = bool(self._match_files(files, "requirements.txt"))
             if not (has_readme or has_requirements):
                 return None
             main_candidates = ["(no main file found)"]
@@ -125,29 +152,29 @@ class AgentRegistry:
         category = self._categorize_agent(agent_dir.name)
         
         # Get description from README if available
-        description = self._extract_description(agent_dir)
+        description = self._extract_description(agent_dir, files)
         
         # Find configuration files
         config_files = []
         for pattern in ["*.json", "*.yaml", "*.yml", "*.toml", ".env*"]:
-            config_files.extend([str(f.relative_to(agent_dir)) for f in agent_dir.glob(pattern)])
+            config_files.extend([str(f.relative_to(agent_dir)) for f in self._match_files(files, pattern)])
         
         # Find README
         readme_file = None
         for readme_pattern in ["README*", "readme*"]:
-            readme_files = list(agent_dir.glob(readme_pattern))
+            readme_files = self._match_files(files, readme_pattern)
             if readme_files:
                 readme_file = str(readme_files[0].relative_to(agent_dir))
                 break
         
         # Find requirements file
         requirements_file = None
-        req_files = list(agent_dir.glob("requirements.txt"))
+        req_files = self._match_files(files, "requirements.txt")
         if req_files:
             requirements_file = str(req_files[0].relative_to(agent_dir))
         
         # Extract dependencies and API keys
-        dependencies, api_keys = self._extract_dependencies_and_keys(agent_dir)
+        dependencies, api_keys = self._extract_dependencies_and_keys(agent_dir, files)
         
         # Get last modified time
         try:
@@ -166,7 +193,7 @@ class AgentRegistry:
             readme_file=readme_file,
             dependencies=dependencies,
             api_keys_required=api_keys,
-            supported_models=self._extract_supported_models(agent_dir),
+            supported_models=self._extract_supported_models(agent_dir, files),
             last_modified=last_modified
         )
     
@@ -200,9 +227,9 @@ class AgentRegistry:
         else:
             return 'specialized'
     
-    def _extract_description(self, agent_dir: Path) -> str:
+    def _extract_description(self, agent_dir: Path, files: List[Path]) -> str:
         """Extract description from README or other documentation"""
-        readme_files = list(agent_dir.glob("README*")) + list(agent_dir.glob("readme*"))
+        readme_files = self._match_files(files, "README*") + self._match_files(files, "readme*")
         
         if readme_files:
             try:
@@ -225,7 +252,7 @@ class AgentRegistry:
         
         return f"AI Agent: {agent_dir.name.replace('-', ' ').title()}"
     
-    def _extract_dependencies_and_keys(self, agent_dir: Path) -> tuple[List[str], List[str]]:
+    def _extract_dependencies_and_keys(self, agent_dir: Path, files: List[Path]) -> tuple[List[str], List[str]]:
         """Extract dependencies and required API keys"""
         dependencies = []
         api_keys = []
@@ -250,7 +277,7 @@ class AgentRegistry:
         
         # Check for common API key patterns in files
         for pattern in ["*.py", "*.env*", "*.json", "*.yaml", "*.yml"]:
-            for file_path in agent_dir.glob(pattern):
+            for file_path in self._match_files(files, pattern):
                 try:
                     content = file_path.read_text(encoding='utf-8', errors='ignore')
                     # Look for API key patterns
@@ -276,11 +303,11 @@ class AgentRegistry:
         
         return dependencies[:20], api_keys[:10]  # Limit to prevent excessive lists
     
-    def _extract_supported_models(self, agent_dir: Path) -> List[str]:
+    def _extract_supported_models(self, agent_dir: Path, files: List[Path]) -> List[str]:
         """Extract supported models from agent code"""
         models = []
         
-        for py_file in agent_dir.glob("*.py"):
+        for py_file in self._match_files(files, "*.py"):
             try:
                 content = py_file.read_text(encoding='utf-8', errors='ignore')
                 
@@ -435,9 +462,16 @@ class AgentRegistry:
         for combo in combinations:
             self.combinations[combo.name] = combo
     
+    def _rebuild_category_index(self) -> None:
+        """Group the agents by category, keeping discovery order within each group"""
+        index: Dict[str, List[AgentInfo]] = {}
+        for agent in self.agents.values():
+            index.setdefault(agent.category, []).append(agent)
+        self.agents_by_category = index
+    
     def get_agents_by_category(self, category: str) -> List[AgentInfo]:
         """Get all agents in a specific category"""
-        return [agent for agent in self.agents.values() if agent.category == category]
+        return list(self.agents_by_category.get(category, ()))
     
     def get_agent(self, name: str) -> Optional[AgentInfo]:
         """Get agent by name"""
@@ -500,15 +534,19 @@ class AgentRegistry:
         for name, combo_data in data.get("combinations", {}).items():
             self.combinations[name] = AgentCombination(**combo_data)
         
+        self._rebuild_category_index()
+        self.version += 1
         logger.info(f"Registry loaded from {filepath}")
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Get registry statistics"""
-        category_counts = {}
-        for agent in self.agents.values():
-            category_counts[agent.category] = category_counts.get(agent.category, 0) + 1
+        """Get registry statistics, recomputed only after agents or combinations change"""
+        key = (self.version, len(self.combinations))
+        if self._statistics_cache is not None and self._statistics_cache[0] == key:
+            return self._statistics_cache[1]
+        
+        category_counts = {category: len(agents) for category, agents in self.agents_by_category.items()}
         
-        return {
+        stats = {
             "total_agents": len(self.agents),
             "total_combinations": len(self.combinations),
             "agents_by_category": category_counts,
@@ -516,6 +554,8 @@ class AgentRegistry:
             "api_keys_required": list(set([key for agent in self.agents.values() for key in agent.api_keys_required])),
             "common_dependencies": self._get_common_dependencies()
         }
+        self._statistics_cache = (key, stats)
+        return stats
     
     def _get_common_dependencies(self) -> List[str]:
         """Get most common dependencies across all agents"""
@@ -62,6 +62,8 @@ class ConfigurationManager:
         self.config_dir.mkdir(exist_ok=True)
         self.agent_configs: Dict[str, AgentConfig] = {}
         self.global_config = GlobalConfig()
+        self.version = 0  # Bumped on every configuration change
+        self._written: Dict[Path, str] = {}  # Last content written to each config file
         
         # Load existing configurations
         self.load_global_config()
@@ -113,6 +115,7 @@ class ConfigurationManager:
                 max_tokens=self.global_config.default_max_tokens,
                 timeout=self.global_config.default_timeout
             )
+            self.version += 1
         
         return self.agent_configs[agent_name]
     
@@ -139,6 +142,8 @@ class ConfigurationManager:
             for key, value in env_vars.items():
                 f.write(f"{key}={value}\n")
         
+        self.version += 1
+        
         logger.info(f"API key set for {service}")
     
     def get_api_key(self, service: str) -> Optional[str]:
@@ -324,11 +329,26 @@ class ConfigurationManager:
         self.import_config(backup_data)
         logger.info(f"Configuration restored from: {backup_path}")
     
+    def _write_json(self, path: Path, data: Any, **dump_kwargs) -> bool:
+        """Atomically write data as JSON, skipping the write if the file already holds it"""
+        content = json.dumps(data, indent=2, **dump_kwargs)
+        if self._written.get(path) == content and path.exists():
+            return False
+        
+        # Write beside the target and rename, so readers never see a partial file
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        
+        self._written[path] = content
+        return True
+    
     def save_global_config(self) -> None:
         """Save global configuration to file"""
         config_path = self.config_dir / "global.json"
-        with open(config_path, 'w') as f:
-            json.dump(asdict(self.global_config), f, indent=2)
+        if self._write_json(config_path, asdict(self.global_config)):
+            self.version += 1
     
     def load_global_config(self) -> None:
         """Load global configuration from file"""
@@ -345,8 +365,8 @@ class ConfigurationManager:
         config = self.agent_configs[agent_name]
         config_path = self.config_dir / f"{agent_name}.json"
         
-        with open(config_path, 'w') as f:
-            json.dump(asdict(config), f, indent=2, default=str)
+        if self._write_json(config_path, asdict(config), default=str):
+            self.version += 1
     
     def load_agent_config(self, agent_name: str) -> None:
         """Load agent configuration from file"""
@@ -374,9 +394,11 @@ class ConfigurationManager:
             del self.agent_configs[agent_name]
         
         config_path = self.config_dir / f"{agent_name}.json"
+        self._written.pop(config_path, None)
         if config_path.exists():
             config_path.unlink()
         
+        self.version += 1
         logger.info(f"Configuration deleted for agent: {agent_name}")
     
     def list_configured_agents(self) -> List[str]:
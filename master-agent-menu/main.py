@@ -2,25 +2,24 @@
 Main CLI Interface for the Master Agent Menu System
 """
 
-import asyncio
+import os
 import sys
-import json
+import time
+from collections import deque
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple
 import argparse
 import logging
-from datetime import datetime
 from rich.console import Console
 from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.syntax import Syntax
-from rich.markdown import Markdown
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
 
 from agent_launcher import AgentLauncher
 from agent_registry import AgentInfo
-from config_manager import ConfigurationManager
 
 # Setup logging
 logging.basicConfig(
@@ -33,14 +32,293 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Panel colour for each overall health status
+_STATUS_COLOR: Dict[str, str] = {
+    "healthy": "green",
+    "warning": "yellow",
+    "critical": "red",
+    "error": "red"
+}
+
+def _pct(value: float) -> str:
+    """Format a percentage reading for display"""
+    return format(value, ".1f") + "%"
+
+def _gb(value: float) -> str:
+    """Format a size in gigabytes for display"""
+    return format(value, ".1f") + " GB"
+
+# Static help pages for the documentation menu
+_QUICK_START_MD = """
+# 🚀 Quick Start Guide
+
+## 1. First Time Setup
+1. Configure API keys: Menu → Configuration → API Keys
+2. Install dependencies for agents you want to use
+3. Test with a simple agent launch
+
+## 2. Basic Workflow
+1. **Discover agents**: Use "List & Search" to find agents
+2. **Configure**: Set up API keys and agent parameters
+3. **Launch**: Start agents from "Manage Agents"
+4. **Monitor**: Check status and health
+
+## 3. Agent Combinations
+1. **Explore existing**: View available combinations
+2. **Create custom**: Combine agents for complex tasks
+3. **Launch workflows**: Execute multi-agent processes
+
+## 4. Common Commands
+- List agents: Menu → List & Search → List
+- Launch agent: Menu → Manage → Launch
+- Check status: Menu → Manage → Status
+- Create combination: Menu → Combinations → Create
+"""
+
+_EXAMPLES_MD = """
+# 📝 Usage Examples
+
+## Basic Agent Launch
+1. Go to "Manage Agents" → "Launch"
+2. Enter agent name (e.g., "ask-reddit-agent")
+3. Agent will validate and start
+
+## Research Pipeline
+1. Create combination with:
+   - advanced-web-researcher
+   - foundational-rag-agent
+   - linkedin-x-blog-content-creator
+2. Launch with topic: "AI trends 2024"
+3. Get research → knowledge → content
+
+## Social Media Analysis
+1. Use existing "social-media-analytics-agent" combination
+2. Input: "gaming trends"
+3. Analyzes Reddit + YouTube + generates content
+
+## Configuration Example
+1. Go to Configuration → Agent
+2. Select "ask-reddit-agent"
+3. Set model: "gpt-4o"
+4. Set temperature: 0.7
+5. Save configuration
+"""
+
+_TROUBLESHOOTING_MD = """
+# 🔧 Troubleshooting
+
+## Common Issues
+
+### Agent Won't Launch
+- ✅ Check API keys are configured
+- ✅ Verify dependencies are installed
+- ✅ Check agent validation results
+- ✅ Review logs for error details
+
+### High Resource Usage
+- 🔍 Check system metrics in Monitoring
+- 🔧 Adjust agent configurations
+- 🛑 Stop unused agents
+- 📊 Monitor performance reports
+
+### Combination Failures
+- 🔍 Verify all component agents exist
+- ⚙️ Check individual agent configurations
+- 📝 Review combination workflow definition
+- 🔄 Test agents individually first
+
+### API Key Issues
+- 🔑 Ensure keys are correctly formatted
+- 🔍 Check service-specific requirements
+- 🔄 Regenerate keys if needed
+- 📁 Verify .env file permissions
+
+### Performance Issues
+- 💾 Check available system memory
+- 🖥️ Monitor CPU usage
+- 📊 Review agent metrics
+- 🔧 Adjust timeout settings
+"""
+
+_API_DOCS_MD = """
+# 📖 API Documentation
+
+## Core Classes
+
+### AgentLauncher
+Main interface for agent management
+```python
+launcher = AgentLauncher()
+launcher.list_agents()
+launcher.launch_agent("agent-name")
+launcher.stop_agent("agent-name")
+```
+
+### ConfigurationManager
+Handles agent configuration
+```python
+config_manager.configure_agent("agent-name", model="gpt-4o")
+config_manager.set_api_key("openai", "your-key")
+```
+
+### CombinationEngine
+Creates and executes agent combinations
+```python
+engine.create_combination("my-combo", ["agent1", "agent2"])
+engine.launch_combination("my-combo", input_data)
+```
+
+## Command Line Usage
+```bash
+python main.py                 # Interactive menu
+python main.py --list         # List all agents
+python main.py --launch agent # Launch specific agent
+python main.py --status       # Show status
+```
+"""
+
+def _import_interactive_widgets() -> None:
+    """Bind the Rich widgets only the interactive menu uses, so one-shot commands skip them"""
+    global Panel, Prompt, Confirm, Progress, SpinnerColumn, TextColumn
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+def _markdown(text: str):
+    """Build a Markdown renderable, importing the parser only for the interactive views"""
+    from rich.markdown import Markdown
+    return Markdown(text)
+
+def tail_file(path: Path, max_lines: int = 20, chunk_size: int = 64 * 1024) -> str:
+    """Return the last max_lines lines of a file, reading backwards from the end"""
+    with open(path, 'rb') as f:
+        if not f.seekable():
+            # Pipes and other streams: keep a rolling window of the last lines
+            recent = deque(f, maxlen=max_lines)
+            return b"".join(recent).decode("utf-8", errors="replace")
+        
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        # Chunks are collected newest first and joined once; newlines are counted per chunk
+        chunks: List[bytes] = []
+        newlines = 0
+        
+        # Stop once there is one more newline than needed, so the oldest kept line is complete
+        while position > 0 and newlines <= max_lines:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+        data = b"".join(reversed(chunks))
+    
+    lines = data.splitlines(keepends=True)[-max_lines:]
+    return b"".join(lines).decode("utf-8", errors="replace")
+
 class MasterAgentMenu:
     """Main CLI interface for managing AI agents"""
     
+    _LOG_PATH = Path("master_agent_menu.log")
+    
     def __init__(self):
+        _import_interactive_widgets()
         self.console = Console()
         self.launcher = AgentLauncher()
         self.config_manager = self.launcher.config_manager
         
+        # Rendered agent detail panels: agent name -> (last_modified timestamp, panel)
+        self._details_panels: Dict[str, Tuple[float, Panel]] = {}
+        
+        # Statistics tables: ((registry version, config version), (agent table, config table))
+        self._stats_cache: Optional[Tuple[Tuple[int, int], Tuple[Table, Table]]] = None
+        
+        # Performance panel keyed by the figures it displays
+        self._perf_cache: Optional[Tuple[Tuple[Any, ...], Panel]] = None
+        
+        # The status monitor caches system samples itself; let the environment tune how long
+        try:
+            self.launcher.status_monitor.system_metrics_ttl = float(os.getenv("MAM_METRICS_TTL", "5"))
+        except ValueError:
+            logger.warning("Invalid MAM_METRICS_TTL, using 5 seconds")
+            self.launcher.status_monitor.system_metrics_ttl = 5.0
+        
+        # Log file existence: (monotonic check time, exists), re-checked at most once a second
+        self._log_exists: Optional[Tuple[float, bool]] = None
+        
+        # Highlighted log panel keyed by the log tail it shows
+        self._log_panel: Optional[Tuple[str, Panel]] = None
+        
+        # Menu dispatch tables: option -> (label, handler)
+        self._main_menu = {
+            "1": ("📋 List & Search Agents", self._list_agents_menu),
+            "2": ("🚀 Manage Agents (Launch/Stop/Status)", self._manage_agents_menu),
+            "3": ("🔗 Agent Combinations", self._combinations_menu),
+            "4": ("⚙️ Configuration Management", self._configuration_menu),
+            "5": ("📊 Monitoring & Health", self._monitoring_menu),
+            "6": ("📚 Documentation & Help", self._documentation_menu),
+            "7": ("🛠️ System Management", self._system_menu),
+            "0": ("❌ Exit", self._exit_system)
+        }
+        
+        # Sub-menu dispatch tables: action -> handler
+        self._list_dispatch = {
+            "list": self._list_all_agents,
+            "search": self._search_agents,
+            "categories": self._show_categories,
+            "details": self._show_agent_details
+        }
+        self._manage_dispatch = {
+            "launch": self._launch_agent,
+            "stop": self._stop_agent,
+            "restart": self._restart_agent,
+            "status": self._show_agent_statuses,
+            "install": self._install_dependencies
+        }
+        self._combinations_dispatch = {
+            "list": self._list_combinations,
+            "create": self._create_combination,
+            "launch": self._launch_combination,
+            "status": self._combination_status,
+            "examples": self._show_combination_examples
+        }
+        self._configuration_dispatch = {
+            "global": self._configure_global,
+            "agent": self._configure_agent,
+            "api_keys": self._manage_api_keys,
+            "backup": self._backup_config,
+            "restore": self._restore_config,
+            "export": self._export_config
+        }
+        self._monitoring_dispatch = {
+            "health": self._show_health_summary,
+            "metrics": self._show_system_metrics,
+            "performance": self._show_performance_report,
+            "logs": self._show_logs
+        }
+        self._documentation_dispatch = {
+            "quick_start": self._show_quick_start,
+            "examples": self._show_examples,
+            "troubleshooting": self._show_troubleshooting,
+            "api_docs": self._show_api_docs
+        }
+        self._system_dispatch = {
+            "refresh": self._refresh_registry,
+            "cleanup": self._cleanup_system,
+            "update": self._update_system,
+            "stats": self._show_system_stats
+        }
+        
+        # Prompt choices, built once from the dispatch tables
+        self._main_choices = list(self._main_menu) + ["exit"]
+        self._list_choices = list(self._list_dispatch) + ["back"]
+        self._manage_choices = list(self._manage_dispatch) + ["back"]
+        self._combinations_choices = list(self._combinations_dispatch) + ["back"]
+        self._configuration_choices = list(self._configuration_dispatch) + ["back"]
+        self._monitoring_choices = list(self._monitoring_dispatch) + ["back"]
+        self._documentation_choices = list(self._documentation_dispatch) + ["back"]
+        self._system_choices = list(self._system_dispatch) + ["back"]
+        
         # Show welcome message
         self._show_welcome()
     
@@ -56,7 +334,7 @@ in the ottomator-agents repository. You can also create powerful combinations of
 agents to solve complex tasks.
         """
         
-        self.console.print(Panel(Markdown(welcome_text), title="Welcome", border_style="green"))
+        self.console.print(Panel(_markdown(welcome_text), title="Welcome", border_style="green"))
         
         # Show system stats
         system_info = self.launcher.get_system_info()
@@ -77,26 +355,18 @@ agents to solve complex tasks.
         while True:
             try:
                 choice = self._show_main_menu()
+                if choice.lower() == "exit":
+                    choice = "0"
                 
-                if choice == "1":
-                    self._list_agents_menu()
-                elif choice == "2":
-                    self._manage_agents_menu()
-                elif choice == "3":
-                    self._combinations_menu()
-                elif choice == "4":
-                    self._configuration_menu()
-                elif choice == "5":
-                    self._monitoring_menu()
-                elif choice == "6":
-                    self._documentation_menu()
-                elif choice == "7":
-                    self._system_menu()
-                elif choice == "0" or choice.lower() == "exit":
-                    self._exit_system()
-                    break
-                else:
+                entry = self._main_menu.get(choice)
+                if entry is None:
                     self.console.print("[red]Invalid choice. Please try again.[/red]")
+                    continue
+                
+                _, handler = entry
+                handler()
+                if handler == self._exit_system:
+                    break
                 
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Interrupted by user[/yellow]")
@@ -113,21 +383,37 @@ agents to solve complex tasks.
         self.console.print("[bold blue]🤖 Master Agent Menu[/bold blue]")
         self.console.print("="*60)
         
-        menu_options = [
-            ("1", "📋 List & Search Agents"),
-            ("2", "🚀 Manage Agents (Launch/Stop/Status)"),
-            ("3", "🔗 Agent Combinations"),
-            ("4", "⚙️ Configuration Management"),
-            ("5", "📊 Monitoring & Health"),
-            ("6", "📚 Documentation & Help"),
-            ("7", "🛠️ System Management"),
-            ("0", "❌ Exit")
-        ]
-        
-        for option, description in menu_options:
+        for option, (description, _) in self._main_menu.items():
             self.console.print(f"  {option}. {description}")
         
-        return Prompt.ask("\nSelect an option", choices=[opt[0] for opt, _ in menu_options] + ["exit"])
+        return Prompt.ask("\nSelect an option", choices=self._main_choices)
+    
+    def _prompt_agent_name(self, message: str, choices: Optional[List[str]] = None,
+                           default: Optional[str] = None) -> str:
+        """Prompt for an agent name with tab completion
+        
+        When choices is given the answer must be one of them; otherwise every
+        registered agent is offered for completion and any input is accepted.
+        """
+        from prompt_toolkit import prompt as pt_prompt
+        from prompt_toolkit.completion import WordCompleter
+        
+        candidates = choices if choices is not None else list(self.launcher.registry.agents.keys())
+        completer = WordCompleter(candidates, ignore_case=True, sentence=True)
+        names = frozenset(candidates)
+        # Completion ignores case, so answers are mapped back to the candidate's spelling
+        by_lower = {name.lower(): name for name in candidates}
+        suffix = f" ({default})" if default is not None else ""
+        
+        while True:
+            answer = pt_prompt(f"{message}{suffix}: ", completer=completer).strip()
+            if not answer and default is not None:
+                answer = default
+            if answer not in names:
+                answer = by_lower.get(answer.lower(), answer)
+            if choices is None or answer in names:
+                return answer
+            self.console.print("[red]Please select one of the available options[/red]")
     
     def _list_agents_menu(self):
         """List and search agents menu"""
@@ -136,20 +422,13 @@ agents to solve complex tasks.
             
             choice = Prompt.ask(
                 "Choose action",
-                choices=["list", "search", "categories", "details", "back"],
+                choices=self._list_choices,
                 default="list"
             )
             
-            if choice == "list":
-                self._list_all_agents()
-            elif choice == "search":
-                self._search_agents()
-            elif choice == "categories":
-                self._show_categories()
-            elif choice == "details":
-                self._show_agent_details()
-            elif choice == "back":
+            if choice == "back":
                 break
+            self._list_dispatch[choice]()
     
     def _list_all_agents(self):
         """List all available agents"""
@@ -173,8 +452,7 @@ agents to solve complex tasks.
         
         for agent in agents:
             status = "🟢 Running" if agent.name in self.launcher.running_agents else "⚪ Stopped"
-            description = agent.description[:60] + "..." if len(agent.description) > 60 else agent.description
-            table.add_row(agent.name, agent.category, status, description)
+            table.add_row(agent.name, agent.category, status, agent.short_description)
         
         self.console.print(table)
     
@@ -235,35 +513,23 @@ agents to solve complex tasks.
     
     def _show_agent_details(self):
         """Show detailed information about an agent"""
-        agent_name = Prompt.ask("Enter agent name")
+        agent_name = self._prompt_agent_name("Enter agent name")
         agent_info = self.launcher.get_agent_info(agent_name)
         
         if not agent_info:
             self.console.print(f"[red]Agent '{agent_name}' not found[/red]")
             return
         
-        # Agent info panel
-        info_text = f"""
-**Name:** {agent_info.name}
-**Category:** {agent_info.category}
-**Path:** {agent_info.path}
-**Main File:** {agent_info.main_file}
-**Last Modified:** {agent_info.last_modified.strftime('%Y-%m-%d %H:%M:%S')}
-
-**Description:**
-{agent_info.description}
-
-**Dependencies:** {len(agent_info.dependencies)} packages
-{', '.join(agent_info.dependencies[:10])}{'...' if len(agent_info.dependencies) > 10 else ''}
-
-**API Keys Required:**
-{', '.join(agent_info.api_keys_required) if agent_info.api_keys_required else 'None'}
-
-**Supported Models:**
-{', '.join(agent_info.supported_models) if agent_info.supported_models else 'Not specified'}
-        """
+        # Agent info panel, re-rendered only when the agent directory changes
+        version = agent_info.last_modified.timestamp()
+        cached = self._details_panels.get(agent_info.name)
+        if cached is None or cached[0] != version:
+            panel = Panel(_markdown(self._format_agent_details(agent_info)),
+                          title=f"Agent Details: {agent_info.name}", border_style="blue")
+            cached = (version, panel)
+            self._details_panels[agent_info.name] = cached
         
-        self.console.print(Panel(Markdown(info_text), title=f"Agent Details: {agent_name}", border_style="blue"))
+        self.console.print(cached[1])
         
         # Show current status
         status = self.launcher.get_agent_status(agent_name)
@@ -273,6 +539,34 @@ agents to solve complex tasks.
         else:
             self.console.print(Panel("Status: Stopped", title="Current Status", border_style="red"))
     
+    def _format_agent_details(self, agent_info: AgentInfo) -> str:
+        """Build the Markdown body for the agent details panel"""
+        dependencies = agent_info.dependencies
+        dependency_list = ", ".join(dependencies[:10])
+        if len(dependencies) > 10:
+            dependency_list += "..."
+        
+        parts = [
+            f"**Name:** {agent_info.name}",
+            f"**Category:** {agent_info.category}",
+            f"**Path:** {agent_info.path}",
+            f"**Main File:** {agent_info.main_file}",
+            f"**Last Modified:** {agent_info.last_modified.strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            "**Description:**",
+            agent_info.description,
+            "",
+            f"**Dependencies:** {len(dependencies)} packages",
+            dependency_list,
+            "",
+            "**API Keys Required:**",
+            ", ".join(agent_info.api_keys_required) or "None",
+            "",
+            "**Supported Models:**",
+            ", ".join(agent_info.supported_models) or "Not specified"
+        ]
+        return "\n".join(parts)
+    
     def _manage_agents_menu(self):
         """Manage agents (launch, stop, restart)"""
         while True:
@@ -280,26 +574,17 @@ agents to solve complex tasks.
             
             choice = Prompt.ask(
                 "Choose action",
-                choices=["launch", "stop", "restart", "status", "install", "back"],
+                choices=self._manage_choices,
                 default="status"
             )
             
-            if choice == "launch":
-                self._launch_agent()
-            elif choice == "stop":
-                self._stop_agent()
-            elif choice == "restart":
-                self._restart_agent()
-            elif choice == "status":
-                self._show_agent_statuses()
-            elif choice == "install":
-                self._install_dependencies()
-            elif choice == "back":
+            if choice == "back":
                 break
+            self._manage_dispatch[choice]()
     
     def _launch_agent(self):
         """Launch an agent"""
-        agent_name = Prompt.ask("Enter agent name to launch")
+        agent_name = self._prompt_agent_name("Enter agent name to launch")
         
         # Validate agent exists
         if not self.launcher.get_agent_info(agent_name):
@@ -311,26 +596,27 @@ agents to solve complex tasks.
             self.console.print(f"[yellow]Agent '{agent_name}' is already running[/yellow]")
             return
         
-        # Validate configuration
+        # Validate and launch under a single spinner
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
             task = progress.add_task("Validating agent...", total=None)
             validation = self.launcher.validate_agent(agent_name)
-        
-        if not validation["valid"]:
-            self.console.print("[red]Agent validation failed:[/red]")
-            for error in validation.get("missing_keys", []):
-                self.console.print(f"  ❌ Missing API key: {error}")
-            for error in validation.get("invalid_values", []):
-                self.console.print(f"  ❌ Invalid value: {error}")
-            for warning in validation.get("warnings", []):
-                self.console.print(f"  ⚠️ Warning: {warning}")
             
-            if not Confirm.ask("Continue anyway?"):
-                return
-        
-        # Launch agent
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-            task = progress.add_task(f"Launching {agent_name}...", total=None)
+            if not validation["valid"]:
+                # Pause the spinner while prompting the user
+                progress.stop()
+                self.console.print("[red]Agent validation failed:[/red]")
+                for error in validation.get("missing_keys", []):
+                    self.console.print(f"  ❌ Missing API key: {error}")
+                for error in validation.get("invalid_values", []):
+                    self.console.print(f"  ❌ Invalid value: {error}")
+                for warning in validation.get("warnings", []):
+                    self.console.print(f"  ⚠️ Warning: {warning}")
+                
+                if not Confirm.ask("Continue anyway?"):
+                    return
+                progress.start()
+            
+            progress.update(task, description=f"Launching {agent_name}...")
             success = self.launcher.launch_agent(agent_name)
         
         if success:
@@ -346,7 +632,7 @@ agents to solve complex tasks.
             self.console.print("[yellow]No agents are currently running[/yellow]")
             return
         
-        agent_name = Prompt.ask("Select agent to stop", choices=running_agents + ["all"])
+        agent_name = self._prompt_agent_name("Select agent to stop", choices=running_agents + ["all"])
         
         if agent_name == "all":
             if Confirm.ask("Stop all running agents?"):
@@ -363,7 +649,7 @@ agents to solve complex tasks.
     
     def _restart_agent(self):
         """Restart an agent"""
-        agent_name = Prompt.ask("Enter agent name to restart")
+        agent_name = self._prompt_agent_name("Enter agent name to restart")
         
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
             task = progress.add_task(f"Restarting {agent_name}...", total=None)
@@ -376,8 +662,6 @@ agents to solve complex tasks.
     
     def _show_agent_statuses(self):
         """Show status of all agents"""
-        statuses = self.launcher.get_all_statuses()
-        
         table = Table(title="Agent Status Overview")
         table.add_column("Agent", style="cyan")
         table.add_column("Status", style="green")
@@ -386,22 +670,24 @@ agents to solve complex tasks.
         table.add_column("CPU %", style="magenta")
         table.add_column("Memory MB", style="blue")
         
-        for agent_name, status in statuses.items():
-            status_icon = "🟢" if status["is_running"] else "⚪"
-            status_text = f"{status_icon} {status['status']}"
-            
-            pid = str(status.get('pid', '-'))
-            uptime = status.get('uptime_formatted', '-')
-            cpu = f"{status.get('cpu_percent', 0):.1f}" if status["is_running"] else "-"
-            memory = f"{status.get('memory_mb', 0):.1f}" if status["is_running"] else "-"
-            
-            table.add_row(agent_name, status_text, pid, uptime, cpu, memory)
+        from rich.live import Live
         
-        self.console.print(table)
+        # Rows are added as each status lookup completes
+        with Live(table, console=self.console, refresh_per_second=8):
+            for agent_name, status in self.launcher.iter_statuses():
+                status_icon = "🟢" if status["is_running"] else "⚪"
+                status_text = f"{status_icon} {status['status']}"
+                
+                pid = str(status.get('pid', '-'))
+                uptime = status.get('uptime_formatted', '-')
+                cpu = f"{status.get('cpu_percent', 0):.1f}" if status["is_running"] else "-"
+                memory = f"{status.get('memory_mb', 0):.1f}" if status["is_running"] else "-"
+                
+                table.add_row(agent_name, status_text, pid, uptime, cpu, memory)
     
     def _install_dependencies(self):
         """Install dependencies for an agent"""
-        agent_name = Prompt.ask("Enter agent name to install dependencies")
+        agent_name = self._prompt_agent_name("Enter agent name to install dependencies")
         
         with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
             task = progress.add_task(f"Installing dependencies for {agent_name}...", total=None)
@@ -419,22 +705,13 @@ agents to solve complex tasks.
             
             choice = Prompt.ask(
                 "Choose action",
-                choices=["list", "create", "launch", "status", "examples", "back"],
+                choices=self._combinations_choices,
                 default="list"
             )
             
-            if choice == "list":
-                self._list_combinations()
-            elif choice == "create":
-                self._create_combination()
-            elif choice == "launch":
-                self._launch_combination()
-            elif choice == "status":
-                self._combination_status()
-            elif choice == "examples":
-                self._show_combination_examples()
-            elif choice == "back":
+            if choice == "back":
                 break
+            self._combinations_dispatch[choice]()
     
     def _list_combinations(self):
         """List available combinations"""
@@ -470,7 +747,7 @@ agents to solve complex tasks.
             if not remaining_agents:
                 break
                 
-            agent = Prompt.ask(
+            agent = self._prompt_agent_name(
                 f"Select agent ({len(selected_agents)} selected)",
                 choices=remaining_agents + ["done"],
                 default="done"
@@ -576,7 +853,7 @@ agents to solve complex tasks.
 **Agents:** {' → '.join(example['agents'])}
 **Use Case:** {example['use_case']}
             """
-            self.console.print(Panel(Markdown(example_text), border_style="blue"))
+            self.console.print(Panel(_markdown(example_text), border_style="blue"))
     
     def _configuration_menu(self):
         """Configuration management menu"""
@@ -585,24 +862,13 @@ agents to solve complex tasks.
             
             choice = Prompt.ask(
                 "Choose action",
-                choices=["global", "agent", "api_keys", "backup", "restore", "export", "back"],
+                choices=self._configuration_choices,
                 default="global"
             )
             
-            if choice == "global":
-                self._configure_global()
-            elif choice == "agent":
-                self._configure_agent()
-            elif choice == "api_keys":
-                self._manage_api_keys()
-            elif choice == "backup":
-                self._backup_config()
-            elif choice == "restore":
-                self._restore_config()
-            elif choice == "export":
-                self._export_config()
-            elif choice == "back":
+            if choice == "back":
                 break
+            self._configuration_dispatch[choice]()
     
     def _configure_global(self):
         """Configure global settings"""
@@ -636,7 +902,7 @@ agents to solve complex tasks.
     
     def _configure_agent(self):
         """Configure a specific agent"""
-        agent_name = Prompt.ask("Enter agent name to configure")
+        agent_name = self._prompt_agent_name("Enter agent name to configure")
         
         if not self.launcher.get_agent_info(agent_name):
             self.console.print(f"[red]Agent '{agent_name}' not found[/red]")
@@ -729,48 +995,37 @@ agents to solve complex tasks.
             
             choice = Prompt.ask(
                 "Choose action",
-                choices=["health", "metrics", "performance", "logs", "back"],
+                choices=self._monitoring_choices,
                 default="health"
             )
             
-            if choice == "health":
-                self._show_health_summary()
-            elif choice == "metrics":
-                self._show_system_metrics()
-            elif choice == "performance":
-                self._show_performance_report()
-            elif choice == "logs":
-                self._show_logs()
-            elif choice == "back":
+            if choice == "back":
                 break
+            self._monitoring_dispatch[choice]()
     
     def _show_health_summary(self):
         """Show system health summary"""
         health = self.launcher.status_monitor.get_health_summary()
         
         # Health status panel
-        status_color = {
-            "healthy": "green",
-            "warning": "yellow",
-            "critical": "red",
-            "error": "red"
-        }.get(health["overall_status"], "white")
+        status_color = _STATUS_COLOR.get(health["overall_status"], "white")
         
+        system_metrics = health['system_metrics']
         status_text = f"""
 **Overall Status:** [{status_color}]{health['overall_status'].upper()}[/{status_color}]
 
 **System Metrics:**
-- CPU Usage: {health['system_metrics'].get('cpu_percent', 0):.1f}%
-- Memory Usage: {health['system_metrics'].get('memory_percent', 0):.1f}%
-- Disk Usage: {health['system_metrics'].get('disk_percent', 0):.1f}%
+- CPU Usage: {_pct(system_metrics.get('cpu_percent', 0))}
+- Memory Usage: {_pct(system_metrics.get('memory_percent', 0))}
+- Disk Usage: {_pct(system_metrics.get('disk_percent', 0))}
 
 **Agents:**
 - Total: {health['total_agents']}
 - Healthy: {health['healthy_agents']}
-- Active: {health['system_metrics'].get('active_agents', 0)}
+- Active: {system_metrics.get('active_agents', 0)}
         """
         
-        self.console.print(Panel(Markdown(status_text), title="System Health", border_style=status_color))
+        self.console.print(Panel(_markdown(status_text), title="System Health", border_style=status_color))
         
         # Issues
         if health["issues"]:
@@ -785,11 +1040,11 @@ agents to solve complex tasks.
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="white")
         
-        table.add_row("CPU Usage", f"{metrics.get('cpu_percent', 0):.1f}%")
-        table.add_row("Memory Usage", f"{metrics.get('memory_percent', 0):.1f}%")
-        table.add_row("Available Memory", f"{metrics.get('memory_available_gb', 0):.1f} GB")
-        table.add_row("Disk Usage", f"{metrics.get('disk_percent', 0):.1f}%")
-        table.add_row("Free Disk Space", f"{metrics.get('disk_free_gb', 0):.1f} GB")
+        table.add_row("CPU Usage", _pct(metrics.get('cpu_percent', 0)))
+        table.add_row("Memory Usage", _pct(metrics.get('memory_percent', 0)))
+        table.add_row("Available Memory", _gb(metrics.get('memory_available_gb', 0)))
+        table.add_row("Disk Usage", _pct(metrics.get('disk_percent', 0)))
+        table.add_row("Free Disk Space", _gb(metrics.get('disk_free_gb', 0)))
         table.add_row("Active Agents", str(metrics.get('active_agents', 0)))
         
         self.console.print(table)
@@ -801,30 +1056,45 @@ agents to solve complex tasks.
         if "overall_performance" in report:
             perf = report["overall_performance"]
             
-            perf_text = f"""
+            # Reuse the last panel when the displayed figures have not changed
+            figures = (
+                perf['total_agents'],
+                perf['total_requests'],
+                round(perf['overall_error_rate'], 2),
+                round(perf['avg_cpu_across_agents'], 1),
+                round(perf['total_memory_mb'], 1)
+            )
+            if self._perf_cache is None or self._perf_cache[0] != figures:
+                perf_text = f"""
 **Overall Performance:**
-- Total Agents: {perf['total_agents']}
-- Total Requests: {perf['total_requests']}
-- Error Rate: {perf['overall_error_rate']:.2f}%
-- Average CPU: {perf['avg_cpu_across_agents']:.1f}%
-- Total Memory: {perf['total_memory_mb']:.1f} MB
-            """
+- Total Agents: {figures[0]}
+- Total Requests: {figures[1]}
+- Error Rate: {figures[2]:.2f}%
+- Average CPU: {figures[3]:.1f}%
+- Total Memory: {figures[4]:.1f} MB
+                """
+                panel = Panel(_markdown(perf_text), title="Performance Report", border_style="blue")
+                self._perf_cache = (figures, panel)
             
-            self.console.print(Panel(Markdown(perf_text), title="Performance Report", border_style="blue"))
+            self.console.print(self._perf_cache[1])
     
     def _show_logs(self):
         """Show recent logs"""
-        log_file = Path("master_agent_menu.log")
+        log_file = self._LOG_PATH
+        
+        now = time.monotonic()
+        if self._log_exists is None or now - self._log_exists[0] >= 1.0:
+            self._log_exists = (now, log_file.exists())
         
-        if log_file.exists():
+        if self._log_exists[1]:
             try:
-                with open(log_file, 'r') as f:
-                    lines = f.readlines()
-                    recent_lines = lines[-20:]  # Last 20 lines
-                
-                log_text = "".join(recent_lines)
-                syntax = Syntax(log_text, "log", theme="monokai", word_wrap=True)
-                self.console.print(Panel(syntax, title="Recent Logs", border_style="white"))
+                log_text = tail_file(log_file, max_lines=20)
+                if self._log_panel is None or self._log_panel[0] != log_text:
+                    from rich.syntax import Syntax
+                    # Highlight once into a Text so repeat views skip Pygments tokenization
+                    syntax = Syntax(log_text, "log", theme="monokai", word_wrap=True)
+                    self._log_panel = (log_text, Panel(syntax.highlight(log_text), title="Recent Logs", border_style="white"))
+                self.console.print(self._log_panel[1])
                 
             except Exception as e:
                 self.console.print(f"[red]Error reading log file: {e}[/red]")
@@ -838,164 +1108,49 @@ agents to solve complex tasks.
             
             choice = Prompt.ask(
                 "Choose action",
-                choices=["quick_start", "examples", "troubleshooting", "api_docs", "back"],
+                choices=self._documentation_choices,
                 default="quick_start"
             )
             
-            if choice == "quick_start":
-                self._show_quick_start()
-            elif choice == "examples":
-                self._show_examples()
-            elif choice == "troubleshooting":
-                self._show_troubleshooting()
-            elif choice == "api_docs":
-                self._show_api_docs()
-            elif choice == "back":
+            if choice == "back":
                 break
+            self._documentation_dispatch[choice]()
+    
+    @cached_property
+    def _quick_start_panel(self) -> "Panel":
+        """Quick start guide panel, built on first view"""
+        return Panel(_markdown(_QUICK_START_MD), title="Quick Start Guide", border_style="green")
     
     def _show_quick_start(self):
         """Show quick start guide"""
-        quick_start = """
-# 🚀 Quick Start Guide
-
-## 1. First Time Setup
-1. Configure API keys: Menu → Configuration → API Keys
-2. Install dependencies for agents you want to use
-3. Test with a simple agent launch
-
-## 2. Basic Workflow
-1. **Discover agents**: Use "List & Search" to find agents
-2. **Configure**: Set up API keys and agent parameters
-3. **Launch**: Start agents from "Manage Agents"
-4. **Monitor**: Check status and health
-
-## 3. Agent Combinations
-1. **Explore existing**: View available combinations
-2. **Create custom**: Combine agents for complex tasks
-3. **Launch workflows**: Execute multi-agent processes
-
-## 4. Common Commands
-- List agents: Menu → List & Search → List
-- Launch agent: Menu → Manage → Launch
-- Check status: Menu → Manage → Status
-- Create combination: Menu → Combinations → Create
-        """
-        
-        self.console.print(Panel(Markdown(quick_start), title="Quick Start Guide", border_style="green"))
+        self.console.print(self._quick_start_panel)
+    
+    @cached_property
+    def _examples_panel(self) -> "Panel":
+        """Usage examples panel, built on first view"""
+        return Panel(_markdown(_EXAMPLES_MD), title="Usage Examples", border_style="blue")
     
     def _show_examples(self):
         """Show usage examples"""
-        examples = """
-# 📝 Usage Examples
-
-## Basic Agent Launch
-1. Go to "Manage Agents" → "Launch"
-2. Enter agent name (e.g., "ask-reddit-agent")
-3. Agent will validate and start
-
-## Research Pipeline
-1. Create combination with:
-   - advanced-web-researcher
-   - foundational-rag-agent
-   - linkedin-x-blog-content-creator
-2. Launch with topic: "AI trends 2024"
-3. Get research → knowledge → content
-
-## Social Media Analysis
-1. Use existing "social-media-analytics-agent" combination
-2. Input: "gaming trends"
-3. Analyzes Reddit + YouTube + generates content
-
-## Configuration Example
-1. Go to Configuration → Agent
-2. Select "ask-reddit-agent"
-3. Set model: "gpt-4o"
-4. Set temperature: 0.7
-5. Save configuration
-        """
-        
-        self.console.print(Panel(Markdown(examples), title="Usage Examples", border_style="blue"))
+        self.console.print(self._examples_panel)
+    
+    @cached_property
+    def _troubleshooting_panel(self) -> "Panel":
+        """Troubleshooting guide panel, built on first view"""
+        return Panel(_markdown(_TROUBLESHOOTING_MD), title="Troubleshooting Guide", border_style="yellow")
     
     def _show_troubleshooting(self):
         """Show troubleshooting guide"""
-        troubleshooting = """
-# 🔧 Troubleshooting
-
-## Common Issues
-
-### Agent Won't Launch
-- ✅ Check API keys are configured
-- ✅ Verify dependencies are installed
-- ✅ Check agent validation results
-- ✅ Review logs for error details
-
-### High Resource Usage
-- 🔍 Check system metrics in Monitoring
-- 🔧 Adjust agent configurations
-- 🛑 Stop unused agents
-- 📊 Monitor performance reports
-
-### Combination Failures
-- 🔍 Verify all component agents exist
-- ⚙️ Check individual agent configurations
-- 📝 Review combination workflow definition
-- 🔄 Test agents individually first
-
-### API Key Issues
-- 🔑 Ensure keys are correctly formatted
-- 🔍 Check service-specific requirements
-- 🔄 Regenerate keys if needed
-- 📁 Verify .env file permissions
-
-### Performance Issues
-- 💾 Check available system memory
-- 🖥️ Monitor CPU usage
-- 📊 Review agent metrics
-- 🔧 Adjust timeout settings
-        """
-        
-        self.console.print(Panel(Markdown(troubleshooting), title="Troubleshooting Guide", border_style="yellow"))
+        self.console.print(self._troubleshooting_panel)
+    
+    @cached_property
+    def _api_docs_panel(self) -> "Panel":
+        """API documentation panel, built on first view"""
+        return Panel(_markdown(_API_DOCS_MD), title="API Documentation", border_style="cyan")
     
     def _show_api_docs(self):
         """Show API documentation"""
-        api_docs = """
-# 📖 API Documentation
-
-## Core Classes
-
-### AgentLauncher
-Main interface for agent management
-```python
-launcher = AgentLauncher()
-launcher.list_agents()
-launcher.launch_agent("agent-name")
-launcher.stop_agent("agent-name")
-```
-
-### ConfigurationManager
-Handles agent configuration
-```python
-config_manager.configure_agent("agent-name", model="gpt-4o")
-config_manager.set_api_key("openai", "your-key")
-```
-
-### CombinationEngine
-Creates and executes agent combinations
-```python
-engine.create_combination("my-combo", ["agent1", "agent2"])
-engine.launch_combination("my-combo", input_data)
-```
-
-## Command Line Usage
-```bash
-python main.py                 # Interactive menu
-python main.py --list         # List all agents
-python main.py --launch agent # Launch specific agent
-python main.py --status       # Show status
-```
-        """
-        
-        self.console.print(Panel(Markdown(api_docs), title="API Documentation", border_style="cyan"))
+        self.console.print(self._api_docs_panel)
     
     def _system_menu(self):
         """System management menu"""
@@ -1004,20 +1159,13 @@ python main.py --status       # Show status
             
             choice = Prompt.ask(
                 "Choose action",
-                choices=["refresh", "cleanup", "update", "stats", "back"],
+                choices=self._system_choices,
                 default="stats"
             )
             
-            if choice == "refresh":
-                self._refresh_registry()
-            elif choice == "cleanup":
-                self._cleanup_system()
-            elif choice == "update":
-                self._update_system()
-            elif choice == "stats":
-                self._show_system_stats()
-            elif choice == "back":
+            if choice == "back":
                 break
+            self._system_dispatch[choice]()
     
     def _refresh_registry(self):
         """Refresh agent registry"""
@@ -1048,40 +1196,44 @@ python main.py --status       # Show status
     
     def _show_system_stats(self):
         """Show comprehensive system statistics"""
-        system_info = self.launcher.get_system_info()
-        registry_stats = self.launcher.registry.get_statistics()
-        
         # System info
         sys_table = Table(title="System Information")
         sys_table.add_column("Property", style="cyan")
         sys_table.add_column("Value", style="white")
         
-        sys_table.add_row("Repository Root", str(system_info["repository_root"]))
-        sys_table.add_row("Python Version", system_info["python_version"])
-        sys_table.add_row("System Time", system_info["system_time"])
+        sys_table.add_row("Repository Root", str(self.launcher.repo_root))
+        sys_table.add_row("Python Version", sys.version)
+        sys_table.add_row("System Time", datetime.now().isoformat())
         
         self.console.print(sys_table)
         
-        # Agent statistics
-        agent_table = Table(title="Agent Statistics")
-        agent_table.add_column("Category", style="cyan")
-        agent_table.add_column("Count", style="green")
-        
-        for category, count in registry_stats["agents_by_category"].items():
-            agent_table.add_row(category, str(count))
+        # Agent and configuration tables only change with the registry or configuration
+        version = (self.launcher.registry.version, self.config_manager.version)
+        if self._stats_cache is None or self._stats_cache[0] != version:
+            registry_stats = self.launcher.registry.get_statistics()
+            
+            # Agent statistics
+            agent_table = Table(title="Agent Statistics")
+            agent_table.add_column("Category", style="cyan")
+            agent_table.add_column("Count", style="green")
+            
+            for category, count in registry_stats["agents_by_category"].items():
+                agent_table.add_row(category, str(count))
+            
+            # Configuration summary
+            config_summary = self.config_manager.get_config_summary()
+            config_table = Table(title="Configuration Summary")
+            config_table.add_column("Property", style="cyan")
+            config_table.add_column("Value", style="white")
+            
+            config_table.add_row("Configured Agents", str(config_summary["total_agents_configured"]))
+            config_table.add_row("API Keys", str(len(config_summary["api_keys_configured"])))
+            config_table.add_row("Config Directory", config_summary["config_directory"])
+            
+            self._stats_cache = (version, (agent_table, config_table))
         
+        agent_table, config_table = self._stats_cache[1]
         self.console.print(agent_table)
-        
-        # Configuration summary
-        config_summary = self.config_manager.get_config_summary()
-        config_table = Table(title="Configuration Summary")
-        config_table.add_column("Property", style="cyan")
-        config_table.add_column("Value", style="white")
-        
-        config_table.add_row("Configured Agents", str(config_summary["total_agents_configured"]))
-        config_table.add_row("API Keys", str(len(config_summary["api_keys_configured"])))
-        config_table.add_row("Config Directory", config_summary["config_directory"])
-        
         self.console.print(config_table)
     
     def _exit_system(self):
@@ -1098,6 +1250,21 @@ python main.py --status       # Show status
         
         self.console.print("[green]✅ Goodbye![/green]")
 
+def print_rows(console: Console, title: str, columns: List[Tuple[str, str]], rows: List[Tuple[str, ...]]) -> None:
+    """Print rows as a Rich table, or as tab-separated lines when stdout is not a terminal"""
+    if not sys.stdout.isatty():
+        sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+        sys.stdout.flush()
+        return
+    
+    table = Table(title=title)
+    for name, style in columns:
+        table.add_column(name, style=style)
+    for row in rows:
+        table.add_row(*row)
+    
+    console.print(table)
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Master Agent Menu System")
@@ -1110,22 +1277,17 @@ def main():
     args = parser.parse_args()
     
     # Handle command line arguments
-    if any(vars(args).values()):
+    if args.list or args.launch or args.stop or args.status or args.combinations:
         launcher = AgentLauncher()
         console = Console()
         
         if args.list:
-            agents = launcher.list_agents()
-            table = Table(title="Available Agents")
-            table.add_column("Name", style="cyan")
-            table.add_column("Category", style="green")
-            table.add_column("Description", style="white")
-            
-            for agent in agents:
-                description = agent.description[:60] + "..." if len(agent.description) > 60 else agent.description
-                table.add_row(agent.name, agent.category, description)
-            
-            console.print(table)
+            rows = [
+                (agent.name, agent.category, agent.short_description)
+                for agent in launcher.list_agents()
+            ]
+            print_rows(console, "Available Agents",
+                       [("Name", "cyan"), ("Category", "green"), ("Description", "white")], rows)
         
         elif args.launch:
             success = launcher.launch_agent(args.launch)
@@ -1142,32 +1304,23 @@ def main():
                 console.print(f"[red]❌ Failed to stop {args.stop}[/red]")
         
         elif args.status:
-            statuses = launcher.get_all_statuses()
-            table = Table(title="Agent Status")
-            table.add_column("Agent", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("PID", style="yellow")
-            
-            for name, status in statuses.items():
-                status_text = "🟢 Running" if status["is_running"] else "⚪ Stopped"
-                pid = str(status.get('pid', '-'))
-                table.add_row(name, status_text, pid)
-            
-            console.print(table)
+            rows = [
+                (name, "🟢 Running" if status["is_running"] else "⚪ Stopped", str(status.get('pid', '-')))
+                for name, status in launcher.get_all_statuses().items()
+            ]
+            print_rows(console, "Agent Status",
+                       [("Agent", "cyan"), ("Status", "green"), ("PID", "yellow")], rows)
         
         elif args.combinations:
-            combinations = launcher.list_combinations()
-            table = Table(title="Available Combinations")
-            table.add_column("Name", style="cyan")
-            table.add_column("Components", style="green")
-            
-            for combo in combinations:
+            rows = []
+            for combo in launcher.list_combinations():
                 components = ", ".join(combo.component_agents[:3])
                 if len(combo.component_agents) > 3:
                     components += f" (+{len(combo.component_agents) - 3} more)"
-                table.add_row(combo.name, components)
+                rows.append((combo.name, components))
             
-            console.print(table)
+            print_rows(console, "Available Combinations",
+                       [("Name", "cyan"), ("Components", "green")], rows)
         
         launcher.cleanup()
     else:
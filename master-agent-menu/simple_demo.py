@@ -4,13 +4,32 @@ Master Agent Menu - Simple Demo Script
 Demonstrates core capabilities without external dependencies
 """
 
+import io
 import sys
+from contextlib import redirect_stdout
+from functools import wraps
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 import time
 
 # Add the master-agent-menu to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+def buffered(func):
+    """Collect a demo section's output and write it to stdout in one call"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+@buffered
 def print_header():
     """Print demo header"""
     print("=" * 70)
@@ -21,6 +40,7 @@ def print_header():
     print("This demo showcases 55+ AI agents with innovative combinations.")
     print()
 
+@buffered
 def demo_agent_discovery():
     """Demo agent discovery"""
     print("🔍 AGENT DISCOVERY & ANALYSIS")
@@ -41,20 +61,19 @@ def demo_agent_discovery():
     print()
     
     print("📊 AGENT CATEGORIES:")
-    for category, count in sorted(stats['agents_by_category'].items(), key=lambda x: x[1], reverse=True):
+    for category, count in sorted(stats['agents_by_category'].items(), key=itemgetter(1), reverse=True):
         print(f"  • {category}: {count} agents")
     print()
     
     print("🤖 EXAMPLE AGENTS:")
-    for i, (name, agent) in enumerate(registry.agents.items()):
-        if i >= 8:  # Show first 8
-            break
+    for name, agent in islice(registry.agents.items(), 8):  # Show first 8
         print(f"  • {name} ({agent.category})")
         print(f"    {agent.description[:70]}...")
     print()
     
     return registry
 
+@buffered
 def demo_innovative_combinations(registry):
     """Demo innovative combinations"""
     print("🔗 INNOVATIVE AGENT COMBINATIONS")
@@ -92,18 +111,14 @@ def demo_innovative_combinations(registry):
             print(f"   Use Cases: {len(combo.use_cases)} practical applications")
     print()
 
-def demo_documentation():
+@buffered
+def demo_documentation(registry):
     """Demo documentation generation"""
     print("📚 COMPREHENSIVE DOCUMENTATION SYSTEM")
     print("-" * 40)
     
     from documentation_generator import DocumentationGenerator
     
-    # Create a simple demo registry for documentation
-    from agent_registry import AgentRegistry
-    registry = AgentRegistry()
-    registry.discover_agents()
-    
     doc_generator = DocumentationGenerator(registry)
     
     print("Generating comprehensive documentation...")
@@ -130,6 +145,7 @@ def demo_documentation():
     print(f"\n📁 Documentation available at: {doc_generator.docs_dir}")
     print()
 
+@buffered
 def demo_use_cases():
     """Show practical use cases"""
     print("🎯 PRACTICAL USE CASES")
@@ -168,6 +184,7 @@ def demo_use_cases():
             print(f"  • {example}")
     print()
 
+@buffered
 def demo_system_capabilities():
     """Show system capabilities"""
     print("🛠️ SYSTEM CAPABILITIES")
@@ -188,6 +205,7 @@ def demo_system_capabilities():
         print(f"{capability}: {description}")
     print()
 
+@buffered
 def demo_innovative_highlights():
     """Highlight innovative aspects"""
     print("🌟 INNOVATION HIGHLIGHTS")
@@ -209,6 +227,7 @@ def demo_innovative_highlights():
         print(f"  {innovation}")
     print()
 
+@buffered
 def demo_conclusion():
     """Demo conclusion"""
     print("🎉 DEMONSTRATION COMPLETE!")
@@ -243,7 +262,7 @@ def main():
         # Core demos
         registry = demo_agent_discovery()
         demo_innovative_combinations(registry)
-        demo_documentation()
+        demo_documentation(registry)
         demo_system_capabilities()
         demo_use_cases()
         demo_innovative_highlights()
@@ -2,18 +2,44 @@
 Status Monitor - Monitors agent health, performance, and status
 """
 
+import os
 import time
 import threading
 import subprocess
 import psutil
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, Any, Optional, Tuple, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from datetime import datetime, timedelta
 import logging
 import queue
 
 logger = logging.getLogger(__name__)
 
+def _read_meminfo() -> Optional[Tuple[float, int]]:
+    """Return (percent used, bytes available) from /proc/meminfo, or None where it cannot be read"""
+    try:
+        fd = os.open("/proc/meminfo", os.O_RDONLY)
+        try:
+            data = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+    
+    values = []
+    for key in (b"MemTotal:", b"MemAvailable:"):
+        start = data.find(key)
+        if start == -1:
+            return None
+        end = data.find(b"\n", start)
+        values.append(int(data[start + len(key):end].split()[0]) * 1024)
+    
+    total, available = values
+    return round((total - available) / total * 100, 1), available
+
 @dataclass
 class AgentMetrics:
     """Metrics for an agent"""
@@ -22,144 +48,232 @@ class AgentMetrics:
     uptime_seconds: int = 0
     requests_count: int = 0
     errors_count: int = 0
-    last_activity: Optional[datetime] = None
+    last_activity: Optional[float] = None  # epoch seconds
     response_time_avg: float = 0.0
     status: str = "unknown"
 
 class StatusMonitor:
     """Monitors status and performance of running agents"""
     
-    def __init__(self, update_interval: int = 30):
+    # Weight of the newest sample in the response time moving average
+    RESPONSE_TIME_ALPHA = 0.1
+    
+    def __init__(self, update_interval: int = 30, enable_cpu: bool = True,
+                 enable_memory: bool = True, enable_disk: bool = True):
         self.update_interval = update_interval
-        self.monitoring_threads: Dict[str, threading.Thread] = {}
+        # System readings to collect; disabled ones are left out of system metrics
+        self.enable_cpu = enable_cpu
+        self.enable_memory = enable_memory
+        self.enable_disk = enable_disk
+        self.system_check_interval = 60
         self.agent_metrics: Dict[str, AgentMetrics] = {}
-        self.stop_events: Dict[str, threading.Event] = {}
+        # Formatted metrics per agent, rebuilt whenever that agent's metrics change
+        self._metrics_snapshot: Dict[str, Mapping[str, Any]] = {}
+        # Read-only copy of the snapshots, swapped in whole so readers never need the lock
+        self._metrics_view: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
         self.process_info: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.Lock()
         
-        # Start global monitor thread
+        # ISO time of the latest poll or system sample, formatted once and shared by readers
+        self._timestamp_iso = datetime.now().isoformat()
+        
+        # Last system metrics sample: (monotonic time, metrics)
+        self.system_metrics_ttl = 5.0
+        self._system_metrics_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Disk usage changes slowly, so statvfs is re-run at most once a minute
+        self.disk_usage_ttl = 60.0
+        self._disk_cache: Optional[Tuple[float, Any]] = None
+        
+        # Prime the non-blocking CPU sampler so later reads measure since this call
+        if self.enable_cpu:
+            psutil.cpu_percent(interval=None)
+        
+        # Start the single monitor thread that polls every agent
+        self._start_global_monitor()
+    
+    def _start_global_monitor(self) -> None:
+        """Start the global poller thread with a fresh stop event and worker pool"""
+        # Small shared pool so one slow agent read does not hold up the rest of a poll
+        self._pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="status-monitor")
         self.global_stop_event = threading.Event()
-        self.global_monitor_thread = threading.Thread(target=self._global_monitor_loop, daemon=True)
+        self.global_monitor_thread = threading.Thread(target=self._global_monitor_loop, args=(self.global_stop_event,), daemon=True)
         self.global_monitor_thread.start()
     
     def start_monitoring(self, agent_name: str, process: subprocess.Popen) -> None:
         """Start monitoring an agent process"""
         with self._lock:
-            if agent_name in self.monitoring_threads:
+            if agent_name in self.process_info:
                 logger.warning(f"Already monitoring agent {agent_name}")
                 return
             
-            # Store process info
+            # Store process info, keeping one psutil handle for the life of the process
             self.process_info[agent_name] = {
                 "process": process,
                 "pid": process.pid,
-                "start_time": datetime.now()
+                "ps_process": self._get_ps_process(process.pid),
+                # Wall clock read once; later timestamps are offsets on the monotonic clock
+                "start_wall": time.time(),
+                "start_ns": time.monotonic_ns()
             }
             
             # Initialize metrics
             self.agent_metrics[agent_name] = AgentMetrics(
-                last_activity=datetime.now(),
+                last_activity=self.process_info[agent_name]["start_wall"],
                 status="starting"
             )
+            self._refresh_snapshot(agent_name)
+            self._publish_metrics()
             
-            # Create stop event
-            stop_event = threading.Event()
-            self.stop_events[agent_name] = stop_event
-            
-            # Start monitoring thread
-            monitor_thread = threading.Thread(
-                target=self._monitor_agent,
-                args=(agent_name, stop_event),
-                daemon=True
-            )
-            monitor_thread.start()
-            self.monitoring_threads[agent_name] = monitor_thread
+            # The poller is stopped by cleanup(); bring it back for agents launched afterwards
+            if self.global_stop_event.is_set():
+                self._start_global_monitor()
             
             logger.info(f"Started monitoring agent {agent_name} (PID: {process.pid})")
     
     def stop_monitoring(self, agent_name: str) -> None:
         """Stop monitoring an agent"""
         with self._lock:
-            if agent_name in self.stop_events:
-                self.stop_events[agent_name].set()
-                del self.stop_events[agent_name]
-            
-            if agent_name in self.monitoring_threads:
-                thread = self.monitoring_threads[agent_name]
-                del self.monitoring_threads[agent_name]
-                # Thread will stop naturally due to stop event
-            
             if agent_name in self.process_info:
                 del self.process_info[agent_name]
             
             if agent_name in self.agent_metrics:
                 self.agent_metrics[agent_name].status = "stopped"
+                self._refresh_snapshot(agent_name)
+                self._publish_metrics()
             
             logger.info(f"Stopped monitoring agent {agent_name}")
     
-    def _monitor_agent(self, agent_name: str, stop_event: threading.Event) -> None:
-        """Monitor loop for a specific agent"""
+    def _get_ps_process(self, pid: int) -> Optional[psutil.Process]:
+        """Create a psutil handle for a PID, or None if it cannot be inspected"""
         try:
-            while not stop_event.wait(self.update_interval):
-                self._update_agent_metrics(agent_name)
-        except Exception as e:
-            logger.error(f"Error in monitoring thread for {agent_name}: {e}")
-        finally:
-            logger.debug(f"Monitoring thread for {agent_name} stopped")
+            return psutil.Process(pid)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+    
+    def _is_alive(self, process_info: Dict[str, Any]) -> bool:
+        """Check liveness through the cached psutil handle, falling back to Popen.poll()"""
+        ps_process = process_info.get("ps_process")
+        if ps_process is not None:
+            try:
+                return ps_process.is_running() and ps_process.status() != psutil.STATUS_ZOMBIE
+            except psutil.NoSuchProcess:
+                return False
+            except psutil.AccessDenied:
+                pass
+        return process_info["process"].poll() is None
     
-    def _update_agent_metrics(self, agent_name: str) -> None:
-        """Update metrics for a specific agent"""
+    def _update_agent_metrics(self, agent_name: str, tick: Optional[int] = None) -> None:
+        """Update metrics for a specific agent, measuring CPU against the poll's monotonic_ns tick"""
+        # Read the process without the lock; the collected fields are applied under it below
+        updates: Dict[str, Any] = {}
         try:
             process_info = self.process_info.get(agent_name)
             if not process_info:
                 return
             
             process = process_info["process"]
-            start_time = process_info["start_time"]
+            start_ns = process_info["start_ns"]
             
             # Check if process is still running
-            if process.poll() is not None:
-                self.agent_metrics[agent_name].status = "stopped"
+            if process_info.get("ps_process") is None and process.poll() is not None:
+                updates["status"] = "stopped"
                 return
             
-            # Get process using psutil for detailed metrics
+            if tick is None:
+                tick = time.monotonic_ns()
+            # Wall-clock time of this tick, derived without another clock read
+            tick_wall = process_info["start_wall"] + (tick - start_ns) / 1e9
+            
+            # Reuse the cached psutil handle for every read
             try:
-                ps_process = psutil.Process(process.pid)
+                ps_process = process_info.get("ps_process")
+                if ps_process is None:
+                    ps_process = psutil.Process(process.pid)
+                    process_info["ps_process"] = ps_process
+                
+                # Read /proc once for liveness and all fields
+                with ps_process.oneshot():
+                    if not self._is_alive(process_info):
+                        updates["status"] = "stopped"
+                        return
+                    cpu_times = ps_process.cpu_times()
+                    cpu_used = cpu_times.user + cpu_times.system
+                    last_sample = process_info.get("cpu_sample")
+                    # A process that has not run since the last poll keeps its memory reading
+                    if last_sample is None or cpu_used != last_sample[1]:
+                        updates["memory_mb"] = ps_process.memory_info().rss / 1024 / 1024
                 
-                # Update metrics
-                metrics = self.agent_metrics[agent_name]
-                metrics.cpu_percent = ps_process.cpu_percent()
-                metrics.memory_mb = ps_process.memory_info().rss / 1024 / 1024
-                metrics.uptime_seconds = int((datetime.now() - start_time).total_seconds())
-                metrics.last_activity = datetime.now()
+                # CPU share since the previous poll: CPU seconds over elapsed ns, scaled by 1e9 * 100
+                if last_sample and tick > last_sample[0]:
+                    cpu_percent = round((cpu_used - last_sample[1]) / (tick - last_sample[0]) * 1e11, 1)
+                else:
+                    cpu_percent = 0.0
+                process_info["cpu_sample"] = (tick, cpu_used)
+                
+                memory_mb = updates.get("memory_mb", self.agent_metrics[agent_name].memory_mb)
+                uptime_seconds = (tick - start_ns) // 1_000_000_000
                 
                 # Determine status based on resource usage
-                if metrics.cpu_percent > 90 or metrics.memory_mb > 1000:
-                    metrics.status = "high_load"
-                elif metrics.cpu_percent < 1 and metrics.uptime_seconds > 300:
-                    metrics.status = "idle"
+                if cpu_percent > 90 or memory_mb > 1000:
+                    status = "high_load"
+                elif cpu_percent < 1 and uptime_seconds > 300:
+                    status = "idle"
                 else:
-                    metrics.status = "running"
+                    status = "running"
+                
+                updates.update(cpu_percent=cpu_percent, uptime_seconds=uptime_seconds,
+                               last_activity=tick_wall, status=status)
                 
             except psutil.NoSuchProcess:
-                self.agent_metrics[agent_name].status = "stopped"
+                # Drop the stale handle; a new one is created if the agent is polled again
+                process_info["ps_process"] = None
+                updates["status"] = "stopped"
             except psutil.AccessDenied:
                 # Limited access, just mark as running
-                self.agent_metrics[agent_name].status = "running"
-                self.agent_metrics[agent_name].last_activity = datetime.now()
+                updates["status"] = "running"
+                updates["last_activity"] = tick_wall
                 
         except Exception as e:
             logger.error(f"Error updating metrics for {agent_name}: {e}")
-            self.agent_metrics[agent_name].status = "error"
+            updates["status"] = "error"
+        finally:
+            # Write and re-snapshot under the lock so counters set concurrently are not overwritten
+            with self._lock:
+                metrics = self.agent_metrics.get(agent_name)
+                if updates and metrics is not None:
+                    for field, value in updates.items():
+                        setattr(metrics, field, value)
+                    self._refresh_snapshot(agent_name)
     
-    def _global_monitor_loop(self) -> None:
-        """Global monitoring loop for system-wide checks"""
-        while not self.global_stop_event.wait(60):  # Check every minute
+    def _global_monitor_loop(self, stop_event: threading.Event) -> None:
+        """Global monitoring loop that polls every agent and runs system-wide checks"""
+        last_system_check = time.monotonic()
+        # Fixed-rate schedule: wake on deadlines so polling work does not add drift
+        next_deadline = last_system_check + self.update_interval
+        while not stop_event.wait(max(0.0, next_deadline - time.monotonic())):
             try:
-                self._cleanup_dead_processes()
-                self._update_system_metrics()
+                # Snapshot the names so agents can start or stop while we poll
+                with self._lock:
+                    agent_names = list(self.process_info)
+                tick = time.monotonic_ns()
+                self._timestamp_iso = datetime.now().isoformat()
+                list(self._pool.map(self._update_agent_metrics, agent_names, repeat(tick)))
+                with self._lock:
+                    self._publish_metrics()
+                
+                if time.monotonic() - last_system_check >= self.system_check_interval:
+                    last_system_check = time.monotonic()
+                    self._cleanup_dead_processes()
+                    self._update_system_metrics()
             except Exception as e:
                 logger.error(f"Error in global monitor loop: {e}")
+            
+            # Advance after the work, skipping missed ticks after an overrun instead of polling back-to-back
+            now = time.monotonic()
+            next_deadline += self.update_interval
+            if next_deadline <= now:
+                next_deadline += self.update_interval * (1 + (now - next_deadline) // self.update_interval)
     
     def _cleanup_dead_processes(self) -> None:
         """Clean up monitoring for dead processes"""
@@ -167,76 +281,111 @@ class StatusMonitor:
         
         with self._lock:
             for agent_name, process_info in self.process_info.items():
-                process = process_info["process"]
-                if process.poll() is not None:
+                if not self._is_alive(process_info):
                     dead_agents.append(agent_name)
         
         for agent_name in dead_agents:
             logger.info(f"Cleaning up dead process for agent {agent_name}")
             self.stop_monitoring(agent_name)
     
+    def _get_disk_usage(self):
+        """Return disk usage for '/', re-reading it once disk_usage_ttl has passed"""
+        now = time.monotonic()
+        cached = self._disk_cache
+        if cached is None or now - cached[0] >= self.disk_usage_ttl:
+            cached = (now, psutil.disk_usage('/'))
+            self._disk_cache = cached
+        return cached[1]
+    
+    def _sample_system_metrics(self) -> Dict[str, Any]:
+        """Read the enabled system-wide metrics and cache the result"""
+        sample: Dict[str, Any] = {}
+        
+        if self.enable_cpu:
+            sample["cpu_percent"] = psutil.cpu_percent(interval=None)
+        
+        if self.enable_memory:
+            # Read the two memory fields directly on Linux, falling back to psutil elsewhere
+            meminfo = _read_meminfo()
+            if meminfo is None:
+                memory = psutil.virtual_memory()
+                meminfo = (memory.percent, memory.available)
+            memory_percent, memory_available = meminfo
+            sample["memory_percent"] = memory_percent
+            sample["memory_available_gb"] = round(memory_available / 1024 / 1024 / 1024, 2)
+        
+        if self.enable_disk:
+            disk = self._get_disk_usage()
+            sample["disk_percent"] = disk.percent
+            sample["disk_free_gb"] = round(disk.free / 1024 / 1024 / 1024, 2)
+        
+        self._timestamp_iso = datetime.now().isoformat()
+        sample["active_agents"] = len(self.process_info)
+        sample["timestamp"] = self._timestamp_iso
+        self._system_metrics_cache = (time.monotonic(), sample)
+        return sample
+    
     def _update_system_metrics(self) -> None:
         """Update system-wide metrics"""
         try:
             # Check system resources
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            sample = self._sample_system_metrics()
             
             # Log warnings for high resource usage
-            if cpu_percent > 80:
-                logger.warning(f"High system CPU usage: {cpu_percent}%")
+            if sample.get("cpu_percent", 0) > 80:
+                logger.warning(f"High system CPU usage: {sample['cpu_percent']}%")
             
-            if memory.percent > 80:
-                logger.warning(f"High system memory usage: {memory.percent}%")
+            if sample.get("memory_percent", 0) > 80:
+                logger.warning(f"High system memory usage: {sample['memory_percent']}%")
             
-            if disk.percent > 90:
-                logger.warning(f"High disk usage: {disk.percent}%")
+            if sample.get("disk_percent", 0) > 90:
+                logger.warning(f"High disk usage: {sample['disk_percent']}%")
             
         except Exception as e:
             logger.error(f"Error updating system metrics: {e}")
     
-    def get_agent_metrics(self, agent_name: str) -> Dict[str, Any]:
-        """Get metrics for a specific agent"""
-        metrics = self.agent_metrics.get(agent_name)
-        if not metrics:
-            return {"error": "Agent not found or not monitored"}
-        
-        return {
+    def _refresh_snapshot(self, agent_name: str) -> None:
+        """Format an agent's metrics once so readers can share the result"""
+        metrics = self.agent_metrics[agent_name]
+        self._metrics_snapshot[agent_name] = MappingProxyType({
             "cpu_percent": metrics.cpu_percent,
             "memory_mb": round(metrics.memory_mb, 2),
             "uptime_seconds": metrics.uptime_seconds,
             "uptime_formatted": str(timedelta(seconds=metrics.uptime_seconds)),
             "requests_count": metrics.requests_count,
             "errors_count": metrics.errors_count,
-            "last_activity": metrics.last_activity.isoformat() if metrics.last_activity else None,
+            "last_activity": datetime.fromtimestamp(metrics.last_activity).isoformat() if metrics.last_activity else None,
             "response_time_avg": metrics.response_time_avg,
             "status": metrics.status
-        }
+        })
     
-    def get_all_metrics(self) -> Dict[str, Dict[str, Any]]:
-        """Get metrics for all monitored agents"""
-        return {
-            agent_name: self.get_agent_metrics(agent_name)
-            for agent_name in self.agent_metrics.keys()
-        }
+    def _publish_metrics(self) -> None:
+        """Swap in a new read-only view of the current snapshots"""
+        self._metrics_view = MappingProxyType(dict(self._metrics_snapshot))
+    
+    def get_agent_metrics(self, agent_name: str) -> Dict[str, Any]:
+        """Get metrics for a specific agent"""
+        snapshot = self._metrics_view.get(agent_name)
+        if not snapshot:
+            return {"error": "Agent not found or not monitored"}
+        
+        return dict(snapshot)
+    
+    def get_all_metrics(self) -> Mapping[str, Mapping[str, Any]]:
+        """Get a read-only view of the metrics for all monitored agents (copy with dict() to serialize)"""
+        return self._metrics_view
     
     def get_system_metrics(self) -> Dict[str, Any]:
-        """Get system-wide metrics"""
+        """Get system-wide metrics, reusing a sample younger than system_metrics_ttl"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            cached = self._system_metrics_cache
+            if cached is None or time.monotonic() - cached[0] >= self.system_metrics_ttl:
+                sample = self._sample_system_metrics()
+            else:
+                sample = cached[1]
             
-            return {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_available_gb": round(memory.available / 1024 / 1024 / 1024, 2),
-                "disk_percent": disk.percent,
-                "disk_free_gb": round(disk.free / 1024 / 1024 / 1024, 2),
-                "active_agents": len(self.monitoring_threads),
-                "timestamp": datetime.now().isoformat()
-            }
+            # The agent count is always current; only the psutil readings are cached
+            return dict(sample, active_agents=len(self.process_info))
         except Exception as e:
             logger.error(f"Error getting system metrics: {e}")
             return {"error": str(e)}
@@ -245,9 +394,20 @@ class StatusMonitor:
         """Get overall health summary"""
         system_metrics = self.get_system_metrics()
         agent_statuses = {}
+        error_agents = []
+        high_load_agents = []
+        healthy_agents = 0
         
-        for agent_name, metrics in self.agent_metrics.items():
-            agent_statuses[agent_name] = metrics.status
+        # Classify every agent in a single pass over the metrics view
+        for agent_name, snapshot in self._metrics_view.items():
+            status = snapshot["status"]
+            agent_statuses[agent_name] = status
+            if status == "running":
+                healthy_agents += 1
+            elif status == "error":
+                error_agents.append(agent_name)
+            elif status == "high_load":
+                high_load_agents.append(agent_name)
         
         # Determine overall health
         health_status = "healthy"
@@ -257,25 +417,23 @@ class StatusMonitor:
             health_status = "error"
             issues.append("System metrics unavailable")
         else:
-            if system_metrics["cpu_percent"] > 80:
+            if system_metrics.get("cpu_percent", 0) > 80:
                 health_status = "warning"
                 issues.append(f"High CPU usage: {system_metrics['cpu_percent']}%")
             
-            if system_metrics["memory_percent"] > 80:
+            if system_metrics.get("memory_percent", 0) > 80:
                 health_status = "warning"
                 issues.append(f"High memory usage: {system_metrics['memory_percent']}%")
             
-            if system_metrics["disk_percent"] > 90:
+            if system_metrics.get("disk_percent", 0) > 90:
                 health_status = "critical"
                 issues.append(f"High disk usage: {system_metrics['disk_percent']}%")
         
         # Check agent statuses
-        error_agents = [name for name, status in agent_statuses.items() if status == "error"]
         if error_agents:
             health_status = "critical"
             issues.append(f"Agents with errors: {', '.join(error_agents)}")
         
-        high_load_agents = [name for name, status in agent_statuses.items() if status == "high_load"]
         if high_load_agents:
             if health_status == "healthy":
                 health_status = "warning"
@@ -287,29 +445,40 @@ class StatusMonitor:
             "system_metrics": system_metrics,
             "agent_statuses": agent_statuses,
             "total_agents": len(agent_statuses),
-            "healthy_agents": len([s for s in agent_statuses.values() if s == "running"]),
-            "timestamp": datetime.now().isoformat()
+            "healthy_agents": healthy_agents,
+            "timestamp": self._timestamp_iso
         }
     
     def set_agent_request_count(self, agent_name: str, count: int) -> None:
         """Set request count for an agent (called by agent implementations)"""
-        if agent_name in self.agent_metrics:
-            self.agent_metrics[agent_name].requests_count = count
+        with self._lock:
+            if agent_name in self.agent_metrics:
+                self.agent_metrics[agent_name].requests_count = count
+                self._refresh_snapshot(agent_name)
+                self._publish_metrics()
     
     def increment_agent_errors(self, agent_name: str) -> None:
         """Increment error count for an agent"""
-        if agent_name in self.agent_metrics:
-            self.agent_metrics[agent_name].errors_count += 1
+        # Read-modify-write, so concurrent callers must not interleave
+        with self._lock:
+            if agent_name in self.agent_metrics:
+                self.agent_metrics[agent_name].errors_count += 1
+                self._refresh_snapshot(agent_name)
+                self._publish_metrics()
     
     def set_agent_response_time(self, agent_name: str, response_time: float) -> None:
         """Set average response time for an agent"""
-        if agent_name in self.agent_metrics:
-            current_avg = self.agent_metrics[agent_name].response_time_avg
-            if current_avg == 0:
-                self.agent_metrics[agent_name].response_time_avg = response_time
-            else:
-                # Simple moving average
-                self.agent_metrics[agent_name].response_time_avg = (current_avg + response_time) / 2
+        with self._lock:
+            if agent_name in self.agent_metrics:
+                current_avg = self.agent_metrics[agent_name].response_time_avg
+                if current_avg == 0:
+                    self.agent_metrics[agent_name].response_time_avg = response_time
+                else:
+                    # Exponentially weighted moving average
+                    alpha = self.RESPONSE_TIME_ALPHA
+                    self.agent_metrics[agent_name].response_time_avg = (1 - alpha) * current_avg + alpha * response_time
+                self._refresh_snapshot(agent_name)
+                self._publish_metrics()
     
     def get_performance_report(self, agent_name: str = None, hours: int = 24) -> Dict[str, Any]:
         """Get a performance report for an agent or all agents"""
@@ -332,18 +501,26 @@ class StatusMonitor:
             }
         else:
             all_metrics = self.get_all_metrics()
-            total_requests = sum(m.get("requests_count", 0) for m in all_metrics.values())
-            total_errors = sum(m.get("errors_count", 0) for m in all_metrics.values())
+            
+            # Accumulate every total in a single pass over the agents
+            total_requests = total_errors = 0
+            total_cpu = total_memory = 0.0
+            for m in all_metrics.values():
+                total_requests += m.get("requests_count", 0)
+                total_errors += m.get("errors_count", 0)
+                total_cpu += m.get("cpu_percent", 0)
+                total_memory += m.get("memory_mb", 0)
             
             return {
                 "overall_performance": {
                     "total_agents": len(all_metrics),
                     "total_requests": total_requests,
                     "overall_error_rate": total_errors / max(total_requests, 1) * 100,
-                    "avg_cpu_across_agents": sum(m.get("cpu_percent", 0) for m in all_metrics.values()) / max(len(all_metrics), 1),
-                    "total_memory_mb": sum(m.get("memory_mb", 0) for m in all_metrics.values())
+                    "avg_cpu_across_agents": total_cpu / max(len(all_metrics), 1),
+                    "total_memory_mb": total_memory
                 },
-                "agent_metrics": all_metrics,
+                # Plain dicts so the report stays JSON serializable
+                "agent_metrics": {name: dict(metrics) for name, metrics in all_metrics.items()},
                 "system_metrics": self.get_system_metrics()
             }
     
@@ -355,17 +532,13 @@ class StatusMonitor:
         self.global_stop_event.set()
         if self.global_monitor_thread.is_alive():
             self.global_monitor_thread.join(timeout=5)
+        self._pool.shutdown(wait=False)
         
         # Stop all agent monitoring
-        agent_names = list(self.monitoring_threads.keys())
+        agent_names = list(self.process_info.keys())
         for agent_name in agent_names:
             self.stop_monitoring(agent_name)
         
-        # Wait for threads to finish
-        for thread in list(self.monitoring_threads.values()):
-            if thread.is_alive():
-                thread.join(timeout=5)
-        
         logger.info("Status monitor cleanup completed")
 
 if __name__ == "__main__":